@@ -16,8 +16,11 @@ See Also:
     https://developer-specs.company-information.service.gov.uk/guides/gettingStarted
 """
 
+import asyncio
 import contextlib
+import dataclasses
 import datetime
+import functools
 import logging
 import typing
 import urllib.parse
@@ -32,6 +35,18 @@ logger = logging.getLogger(__name__)
 LimiterContextT = typing.Callable[[], typing.AsyncContextManager[None]]
 ModelT = typing.TypeVar("ModelT", bound=types.base.BaseModel)
 
+
+@functools.lru_cache(maxsize=64)
+def _parametrized(generic_model: typing.Type[ModelT], item_type: typing.Any) -> typing.Type[ModelT]:
+    """Return ``generic_model[item_type]``, memoized across requests.
+
+    Subscripting a generic pydantic model goes through pydantic's own
+    parametrization machinery on every call; endpoint methods use a small,
+    fixed set of combinations, so the resolved classes are cached here.
+    """
+    return generic_model[item_type]  # type: ignore[index]
+
+
 CompanyNumberStrT = typing.Annotated[
     str,
     pydantic.StringConstraints(min_length=1, pattern="^[A-Za-z0-9]{1,8}$"),
@@ -47,12 +62,57 @@ PscIdStrT = typing.Annotated[
     pydantic.StringConstraints(min_length=1),
 ]
 
+#: Largest ``size`` the cursor-based search endpoints accept per request.
+_MAX_CURSOR_PAGE_SIZE = 100
+
+
+CursorPageSizeT = typing.Annotated[
+    int,
+    pydantic.Field(ge=1, le=_MAX_CURSOR_PAGE_SIZE),
+]
+
+
+def _cursor_page_size(page_size: int, remaining: int) -> int:
+    """Pick the ``size`` to request from a cursor-based search endpoint.
+
+    When more results are still wanted than ``page_size``, the request size is
+    raised towards ``remaining`` (up to the API maximum) so the results arrive
+    in as few round-trips as possible. ``page_size`` itself is never reduced;
+    callers validate it against the API maximum.
+    """
+    return max(page_size, min(remaining, _MAX_CURSOR_PAGE_SIZE))
+
 
 @contextlib.asynccontextmanager
 async def _noop_limiter() -> typing.AsyncGenerator[None, None]:
     yield None
 
 
+def _copy_error(err: Exception) -> Exception:
+    """Return a shallow copy of ``err``, or ``err`` itself if it cannot be copied.
+
+    The copy is built without calling ``__init__`` (e.g.
+    :class:`httpx.HTTPStatusError` requires keyword-only arguments) and
+    shares the original's attributes. Exception types without an instance
+    ``__dict__``, such as :class:`pydantic.ValidationError`, are returned
+    unchanged.
+    """
+    try:
+        clone = type(err).__new__(type(err), *err.args)
+        clone.__dict__.update(err.__dict__)
+    except (AttributeError, TypeError):
+        return err
+    return clone
+
+
+@dataclasses.dataclass(slots=True)
+class _InflightGet:
+    """A GET request shared by the callers currently awaiting it."""
+
+    task: asyncio.Future
+    waiters: int = 0
+
+
 class Client:
     """Async client for the Companies House API.
 
@@ -83,11 +143,11 @@ class Client:
             ...     print(f"{profile.company_name} - Status: {profile.company_status}")
             ...     # Fetch company officers
             ...     officers = await client.get_officer_list("09370755")
-            ...     async for officer in officers:
+            ...     for officer in officers.data:
             ...         print(f"Officer: {officer.name}")
             ...     # Search for companies
             ...     results = await client.search_companies("Apple")
-            ...     async for result in results:
+            ...     for result in results.data:
             ...         print(f"Found: {result.title} ({result.company_number})")
             ...
             ...  # doctest: +SKIP
@@ -108,6 +168,7 @@ class Client:
     _owns_session: bool  # Track if we created the session (for cleanup)
     _session_auth: typing.Optional[httpx.BasicAuth]  # Stored to allow session restart
     _page_token_serializer: typing.Optional[types.pagination.types.PageTokenSerializer]
+    _inflight_gets: dict[tuple[str, type], _InflightGet]  # Shared GETs, keyed by (url, result type)
 
     def __init__(
         self,
@@ -129,6 +190,12 @@ class Client:
             - An :class:`~ch_api.api_settings.AuthSettings` instance containing an API key
             - A pre-configured :class:`httpx.AsyncClient` with authentication headers already set
 
+            Every request made by the client - including each page fetched by
+            the paginated methods - goes through this one session, so its
+            connection pool keeps connections alive between pages instead of
+            re-doing the TCP/TLS handshake. To tune the pool or enable HTTP/2
+            (requires ``httpx[http2]``), pass your own ``httpx.AsyncClient``.
+
         settings : api_settings.ApiSettings, optional
             API endpoint configuration. Defaults to :data:`~ch_api.api_settings.LIVE_API_SETTINGS`.
             Use :data:`~ch_api.api_settings.TEST_API_SETTINGS` for the sandbox environment.
@@ -179,6 +246,16 @@ class Client:
 
             client = Client(credentials=auth, api_limiter=rate_limiter)
 
+        Share a tuned HTTP/2 session across all requests::
+
+            session = httpx.AsyncClient(
+                http2=True,
+                auth=httpx.BasicAuth(username="your-api-key", password=""),
+                headers={"ACCEPT": "application/json"},
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+            client = Client(credentials=session)
+
         Use as async context manager for automatic cleanup::
 
             async with Client(credentials=auth) as client:
@@ -209,6 +286,7 @@ class Client:
         else:
             self._api_limiter = api_limiter
         self._page_token_serializer = page_token_serializer
+        self._inflight_gets = {}
 
     def _new_session(self) -> httpx.AsyncClient:
         """Create a fresh AsyncClient using the stored auth credentials."""
@@ -288,13 +366,15 @@ class Client:
                 )
             elif not response.content:
                 raise exc.UnexpectedApiResponseError("Expected response body but got empty content.")
-            return expected_out.model_validate(response.json())  # type: ignore[return-value]
+            # Hand the raw bytes to the model so the body is parsed by pydantic-core's
+            # JSON parser rather than the stdlib ``json`` module behind ``response.json()``.
+            return expected_out.model_validate_json(response.content)  # type: ignore[return-value]
 
     async def _get_resource(
         self,
         url: str,
         result_type: typing.Type[ModelT],
-    ) -> typing.Optional[ModelT]:  # noqa: C901
+    ) -> typing.Optional[ModelT]:
         """Helper method for simple GET requests.
 
         Reduces duplication for endpoints that just need to fetch a resource.
@@ -310,9 +390,53 @@ class Client:
         -------
         ModelT
             The validated API response
+
+        Note
+        ----
+        Concurrent calls for the same ``url`` and ``result_type`` share a
+        single HTTP request: callers arriving while it is in flight await
+        the same result (or exception). The first caller receives the
+        validated model and every later caller receives a deep copy, so no
+        two callers hold the same mutable object. If the request fails, each
+        caller raises its own copy of the error (see :func:`_copy_error`), so
+        tracebacks are not shared between callers. The request is cancelled
+        once every caller awaiting it has been cancelled.
         """
-        request = self._api_session.build_request(method="GET", url=url)
-        return await self._execute_request(request, result_type)
+        key = (url, result_type)
+        inflight = self._inflight_gets.get(key)
+        is_first = inflight is None
+        if inflight is None:
+            request = self._api_session.build_request(method="GET", url=url)
+            inflight = _InflightGet(asyncio.ensure_future(self._execute_request(request, result_type)))
+            self._inflight_gets[key] = inflight
+            inflight.task.add_done_callback(lambda _: self._forget_inflight(key, inflight))
+        inflight.waiters += 1
+        try:
+            # Shield the shared request so one caller being cancelled does not
+            # cancel it for everybody else waiting on it.
+            result = await asyncio.shield(inflight.task)
+        except Exception as err:
+            # Every caller raising the shared exception object would keep
+            # appending its frames to the same __traceback__.
+            own_err = _copy_error(err)
+            if own_err is err:
+                raise
+            raise own_err.with_traceback(err.__traceback__) from err.__cause__
+        finally:
+            inflight.waiters -= 1
+            if not inflight.waiters and not inflight.task.done():
+                # The last caller left before the response arrived: stop the
+                # request so it releases its limiter slot and connection.
+                inflight.task.cancel()
+                self._forget_inflight(key, inflight)
+        if is_first or result is None:
+            return result
+        return result.model_copy(deep=True)
+
+    def _forget_inflight(self, key: tuple[str, type], inflight: _InflightGet) -> None:
+        """Drop ``inflight`` from the shared GETs unless it has been replaced."""
+        if self._inflight_gets.get(key) is inflight:
+            del self._inflight_gets[key]
 
     # ------------------------------------------------------------------
     # Token encode / decode helpers
@@ -362,30 +486,30 @@ class Client:
         items: list = []
         total_count: typing.Optional[int] = None
         has_next = False
-        last_page_len = 0
 
         while True:
             page_items, page_total = await fetch_page_fn(current_start)
-            last_page_len = len(page_items)
             if page_total is not None:
                 total_count = page_total
             items.extend(page_items)
+            # ``current_start`` now points at the first item of the next page.
+            current_start += len(page_items)
 
-            has_next = bool(total_count is not None and page_items and (current_start + last_page_len) < total_count)
+            has_next = bool(page_items) and total_count is not None and current_start < total_count
 
             if not has_next or len(items) >= result_count:
                 break
 
-            current_start += last_page_len
-
         next_page_out: typing.Optional[types.pagination.types.NextPageToken] = None
         if has_next:
-            next_state = types.pagination.types._PageState(start_index=current_start + last_page_len)
+            next_state = types.pagination.types._PageState(start_index=current_start)
             next_page_out = self._encode_next_page(next_state)
 
-        return types.pagination.types.MultipageList(
+        # ``items`` already holds validated models and the pagination values are
+        # computed here, so build both objects without re-validating them.
+        return types.pagination.types.MultipageList.model_construct(
             data=items,
-            pagination=types.pagination.types.PaginationInfo(
+            pagination=types.pagination.types.PaginationInfo.model_construct(
                 has_next=has_next,
                 next_page=next_page_out,
                 size=total_count,
@@ -420,27 +544,28 @@ class Client:
         )
         cursor = page_state.search_below
         items: list = []
-        has_next = False
-        next_cursor: typing.Optional[str] = None
 
         while True:
             page_items, next_cursor = await fetch_page_fn(cursor)
             items.extend(page_items)
-            has_next = next_cursor is not None
 
-            if not has_next or len(items) >= result_count:
+            if next_cursor is None or len(items) >= result_count:
                 break
 
             cursor = next_cursor
 
+        # The last cursor returned by the API is the only pagination state.
+        has_next = next_cursor is not None
         next_page_out: typing.Optional[types.pagination.types.NextPageToken] = None
-        if has_next and next_cursor is not None:
+        if next_cursor is not None:
             next_state = types.pagination.types._PageState(search_below=next_cursor)
             next_page_out = self._encode_next_page(next_state)
 
-        return types.pagination.types.MultipageList(
+        # ``items`` already holds validated models and the pagination values are
+        # computed here, so build both objects without re-validating them.
+        return types.pagination.types.MultipageList.model_construct(
             data=items,
-            pagination=types.pagination.types.PaginationInfo(
+            pagination=types.pagination.types.PaginationInfo.model_construct(
                 has_next=has_next,
                 next_page=next_page_out,
                 size=None,
@@ -467,10 +592,13 @@ class Client:
         if self._settings.test_data_generator_url is None:
             raise RuntimeError("Test Data Generator URL is not configured in the current ApiSettings.")
         url = f"{self._settings.test_data_generator_url}/test-companies"
+        # Serialise straight to JSON bytes in pydantic-core rather than dumping
+        # to Python objects and having httpx encode them a second time.
         request = self._api_session.build_request(
             method="POST",
             url=url,
-            json=company.model_dump(mode="json"),
+            content=company.model_dump_json(),
+            headers={"Content-Type": "application/json"},
         )
         return await self._execute_request(request, types.test_data_generator.CreateTestCompanyResponse)
 
@@ -558,9 +686,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.GenericSearchResult[  # type: ignore[arg-type]
-                        types.public_data.company_officers.OfficerSummary
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.GenericSearchResult,
+                        types.public_data.company_officers.OfficerSummary,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
@@ -616,9 +745,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.GenericSearchResult[  # type: ignore[arg-type]
-                        types.public_data.search.AnySearchResultT
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.GenericSearchResult,
+                        types.public_data.search.AnySearchResultT,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
@@ -686,9 +816,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.AdvancedSearchResult[  # type: ignore[arg-type]
-                        types.public_data.search_companies.AdvancedCompany
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.AdvancedSearchResult,
+                        types.public_data.search_companies.AdvancedCompany,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
@@ -704,7 +835,7 @@ class Client:
     async def alphabetical_companies_search(
         self,
         query: str,
-        page_size: typing.Annotated[int, pydantic.conint(ge=1, le=100)] = 10,
+        page_size: CursorPageSizeT = 10,
         next_page: typing.Optional[types.pagination.types.NextPageToken] = None,
         result_count: int = 1,
     ) -> types.pagination.types.MultipageList[types.public_data.search_companies.AlphabeticalCompany]:
@@ -715,30 +846,38 @@ class Client:
             query: str
                 The search query string.
             page_size: int
-                Number of results per API page (1-100, default 10).
+                Number of results per API page (1-100, default 10; larger
+                values raise a ``pydantic.ValidationError``). Each request is
+                raised towards the number of results still needed for
+                ``result_count`` (up to 100), to save round-trips.
             next_page: str, optional
                 Cursor from a previous call to continue pagination.
             result_count: int
                 Minimum number of results to return (default 1 = one API page).
         """
         base_url = f"{self._settings.api_url}/alphabetical-search/companies"
+        fetched = 0
 
         async def _fetch(
             search_below: typing.Optional[str],
         ) -> tuple[list, typing.Optional[str]]:
-            params: dict = {"q": query, "size": str(page_size)}
+            nonlocal fetched
+            request_size = _cursor_page_size(page_size, result_count - fetched)
+            params: dict = {"q": query, "size": str(request_size)}
             if search_below is not None:
                 params["search_below"] = search_below
             url = f"{base_url}?{urllib.parse.urlencode(params)}"
             result = await self._get_resource(
                 url,
-                types.public_data.search_companies.AlphabeticalCompanySearchResult[  # type: ignore[arg-type]
-                    types.public_data.search_companies.AlphabeticalCompany
-                ],
+                _parametrized(
+                    types.public_data.search_companies.AlphabeticalCompanySearchResult,
+                    types.public_data.search_companies.AlphabeticalCompany,
+                ),
             )
             items = result.items if result is not None else []
             if not items:
                 return [], None
+            fetched += len(items)
             next_cursor = items[-1].ordered_alpha_key_with_id
             return items, next_cursor
 
@@ -748,7 +887,7 @@ class Client:
     async def search_dissolved_companies(
         self,
         query: str,
-        page_size: typing.Annotated[int, pydantic.conint(ge=1, le=100)] = 10,
+        page_size: CursorPageSizeT = 10,
         type: typing.Literal["alphabetical", "best-match", "previous-name-dissolved"] = "alphabetical",  # noqa: A002
         next_page: typing.Optional[types.pagination.types.NextPageToken] = None,
         result_count: int = 1,
@@ -760,7 +899,10 @@ class Client:
             query: str
                 The search query string.
             page_size: int
-                Number of results per API page (1-100, default 10).
+                Number of results per API page (1-100, default 10; larger
+                values raise a ``pydantic.ValidationError``). Each request is
+                raised towards the number of results still needed for
+                ``result_count`` (up to 100), to save round-trips.
             type: str
                 Search type (alphabetical, best-match, previous-name-dissolved).
             next_page: str, optional
@@ -769,23 +911,28 @@ class Client:
                 Minimum number of results to return (default 1 = one API page).
         """
         base_url = f"{self._settings.api_url}/dissolved-search/companies"
+        fetched = 0
 
         async def _fetch(
             search_below: typing.Optional[str],
         ) -> tuple[list, typing.Optional[str]]:
-            params: dict = {"q": query, "size": str(page_size), "search_type": type}
+            nonlocal fetched
+            request_size = _cursor_page_size(page_size, result_count - fetched)
+            params: dict = {"q": query, "size": str(request_size), "search_type": type}
             if search_below is not None:
                 params["search_below"] = search_below
             url = f"{base_url}?{urllib.parse.urlencode(params)}"
             result = await self._get_resource(
                 url,
-                types.public_data.search_companies.AlphabeticalCompanySearchResult[  # type: ignore[arg-type]
-                    types.public_data.search_companies.DissolvedCompany
-                ],
+                _parametrized(
+                    types.public_data.search_companies.AlphabeticalCompanySearchResult,
+                    types.public_data.search_companies.DissolvedCompany,
+                ),
             )
             items = result.items if result is not None else []
             if not items:
                 return [], None
+            fetched += len(items)
             next_cursor = items[-1].ordered_alpha_key_with_id
             return items, next_cursor
 
@@ -818,9 +965,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.GenericSearchResult[  # type: ignore[arg-type]
-                        types.public_data.search.CompanySearchItem
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.GenericSearchResult,
+                        types.public_data.search.CompanySearchItem,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
@@ -859,9 +1007,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.GenericSearchResult[  # type: ignore[arg-type]
-                        types.public_data.search.OfficerSearchItem
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.GenericSearchResult,
+                        types.public_data.search.OfficerSearchItem,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
@@ -900,9 +1049,10 @@ class Client:
             try:
                 result = await self._get_resource(
                     url,
-                    types.public_data.search_companies.GenericSearchResult[  # type: ignore[arg-type]
-                        types.public_data.search.DisqualifiedOfficerSearchItem
-                    ],
+                    _parametrized(
+                        types.public_data.search_companies.GenericSearchResult,
+                        types.public_data.search.DisqualifiedOfficerSearchItem,
+                    ),
                 )
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == httpx.codes.REQUESTED_RANGE_NOT_SATISFIABLE:
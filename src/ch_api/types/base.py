@@ -6,12 +6,31 @@ See Also:
     https://docs.pydantic.dev/latest/
 """
 
+import sys
 import typing
+import weakref
 
 import pydantic
+import pydantic_core
 
 from . import settings
 
+#: Cache for :func:`_canonical_keys`; weak keys let dynamically created model
+#: classes (e.g. parametrized generics) be garbage collected.
+_CANONICAL_KEYS: weakref.WeakKeyDictionary[type[pydantic.BaseModel], frozenset[str]] = weakref.WeakKeyDictionary()
+
+
+def _canonical_keys(model_cls: type[pydantic.BaseModel]) -> frozenset[str]:
+    """Return the keys that :meth:`BaseModel.model_validate` passes through unchanged.
+
+    Responses whose keys are all declared field names are already in canonical
+    form, so the normalization copy can be skipped for them.
+    """
+    keys = _CANONICAL_KEYS.get(model_cls)
+    if keys is None:
+        keys = _CANONICAL_KEYS[model_cls] = frozenset(model_cls.model_fields)
+    return keys
+
 
 class BaseModel(pydantic.BaseModel):
     """Base Pydantic model for Companies House API responses.
@@ -40,6 +59,9 @@ class BaseModel(pydantic.BaseModel):
         2. **Whitespace trimming**: Removes leading/trailing whitespace from field names
         3. **Deprecated field filtering**: Removes fields marked as ``[notinuse]``
 
+        Dictionaries whose keys are all declared field names are passed to
+        Pydantic as-is, so well-formed responses skip the normalization copy.
+
         Parameters
         ----------
         data : Any
@@ -77,14 +99,76 @@ class BaseModel(pydantic.BaseModel):
         --------
         pydantic.BaseModel.model_validate : Parent Pydantic validation method
         """
-        if isinstance(data, dict):
-            updated_data = {}
-            for key, value in data.items():
-                if isinstance(key, str):
-                    key = key.lower().strip()
-                    if "[notinuse]" in key:
-                        # Skip fields that are marked as not in use
-                        continue
-                updated_data[key] = value
-            data = updated_data
-        return super().model_validate(data)
+        return super().model_validate(cls._normalize_keys(data), **kwargs)
+
+    @classmethod
+    def _normalize_keys(cls, data: typing.Any) -> typing.Any:
+        """Return ``data`` with normalized field names and ``[notinuse]`` fields removed.
+
+        Non-dict data and dictionaries whose keys are all declared field names
+        are returned unchanged (the same object).
+        """
+        if not isinstance(data, dict) or _canonical_keys(cls).issuperset(data):
+            return data
+        updated_data = {}
+        for key, value in data.items():
+            if isinstance(key, str):
+                # Interned keys match the (interned) field names by identity
+                # during pydantic-core's dict lookups.
+                key = sys.intern(key.lower().strip())
+                if "[notinuse]" in key:
+                    # Skip fields that are marked as not in use
+                    continue
+            updated_data[key] = value
+        return updated_data
+
+    @classmethod
+    def model_validate_json(  # type: ignore[override]
+        cls, json_data: str | bytes | bytearray, **kwargs: typing.Any
+    ) -> "BaseModel":
+        """Validate and create model instance from a raw JSON API response body.
+
+        The body is decoded with pydantic-core's JSON parser and then passed
+        through :meth:`model_validate`, so field name normalization and
+        ``[notinuse]`` filtering apply exactly as they do for dictionaries.
+
+        With ``strict=True`` the (normalized) document is validated in JSON
+        mode instead, because strict mode accepts JSON-only input forms such
+        as ISO 8601 date strings. Malformed JSON raises
+        :class:`pydantic.ValidationError` in both cases.
+
+        Parameters
+        ----------
+        json_data : str | bytes | bytearray
+            The JSON document, typically ``response.content`` from an HTTP call.
+
+        Returns
+        -------
+        BaseModel
+            A validated model instance with normalized field names and
+            deprecated fields removed.
+
+        Example
+        -------
+        Validate a response body with mixed-case field names::
+
+            >>> class Example(BaseModel):
+            ...     company_number: str
+            >>> Example.model_validate_json(b'{"Company_Number": "09370755"}')
+            Example(company_number='09370755')
+
+        See Also
+        --------
+        model_validate : Validation of already-decoded data
+        """
+        try:
+            data = pydantic_core.from_json(json_data)
+        except ValueError:
+            # Let pydantic report the malformed document as a ValidationError.
+            return super().model_validate_json(json_data, **kwargs)
+        if kwargs.get("strict"):
+            normalized = cls._normalize_keys(data)
+            if normalized is not data:
+                json_data = pydantic_core.to_json(normalized)
+            return super().model_validate_json(json_data, **kwargs)
+        return cls.model_validate(data, **kwargs)
@@ -12,8 +12,10 @@ See Also:
 """
 
 import logging
+import sys
 import typing
 
+import pydantic
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema
 
@@ -23,6 +25,7 @@ T = typing.TypeVar("T")
 
 __all__ = [
     "UndocumentedNullable",
+    "EmptyObjectAsNone",
     "RelaxedLiteral",
 ]
 
@@ -46,6 +49,28 @@ __all__ = [
 UndocumentedNullable = typing.Optional[T]
 
 
+def _empty_object_as_none(value: typing.Any) -> typing.Any:
+    return None if value == {} else value
+
+
+#: Validator treating an empty JSON object as a missing value.
+#:
+#: The API sends some optional nested objects (e.g. officer addresses) as ``{}``
+#: rather than omitting them. Adding this to an optional model field's
+#: ``Annotated`` metadata turns ``{}`` into ``None`` before the nested model is
+#: built, instead of creating an instance with every attribute unset.
+#:
+#: Example:
+#:     .. code-block:: python
+#:
+#:         address: typing.Annotated[
+#:             Address | None,
+#:             field_types.EmptyObjectAsNone,
+#:             pydantic.Field(default=None),
+#:         ]
+EmptyObjectAsNone = pydantic.BeforeValidator(_empty_object_as_none)
+
+
 def RelaxedLiteral(*expected_values: str):
     """Create a relaxed literal type that accepts any string but logs unexpected values.
 
@@ -75,6 +100,7 @@ def RelaxedLiteral(*expected_values: str):
     - **Informative warnings**: Logs when unexpected values are encountered
     - **Nullable support**: Automatically allows ``None`` for optional fields
     - **Type safety**: Integrates seamlessly with Pydantic validation
+    - **Shared values**: Known values are returned as a single interned string
 
     Example
     -------
@@ -155,7 +181,10 @@ def RelaxedLiteral(*expected_values: str):
     class _RelaxedLiteral:
         """Internal class implementing the relaxed literal validation logic."""
 
-        _expected_values = set(expected_values)
+        # Interned so every model holding a known value shares a single string
+        # object; pydantic-core's literal validator returns these exact objects.
+        _expected_values = tuple(sorted(sys.intern(value) for value in set(expected_values)))
+        _expected_values_text = ", ".join(_expected_values)
 
         @classmethod
         def __get_pydantic_core_schema__(
@@ -163,6 +192,11 @@ def RelaxedLiteral(*expected_values: str):
         ) -> core_schema.CoreSchema:
             """Create the Pydantic core schema for relaxed literal validation.
 
+            Known values are matched by a ``literal_schema`` inside pydantic-core,
+            so ``None`` and expected values are validated without calling into
+            Python; any other string falls through to a validator that logs the
+            warning.
+
             Parameters
             ----------
             source_type : Any
@@ -177,12 +211,12 @@ def RelaxedLiteral(*expected_values: str):
                 The validation schema for this type
             """
 
-            def validate_and_log(value: typing.Any, info: core_schema.ValidationInfo) -> typing.Any:
-                """Validate value and log warnings for unexpected strings.
+            def log_unexpected(value: str, info: core_schema.ValidationInfo) -> str:
+                """Log a warning for a string outside the expected values.
 
                 Parameters
                 ----------
-                value : Any
+                value : str
                     The value to validate
 
                 info : core_schema.ValidationInfo
@@ -190,35 +224,26 @@ def RelaxedLiteral(*expected_values: str):
 
                 Returns
                 -------
-                Any
+                str
                     The validated value (passed through unchanged)
                 """
-                # Allow None to pass through without validation
-                if value is None:
-                    return value
-
-                # Convert to string and validate
-                str_value = str(value)
-                if str_value not in cls._expected_values:
-                    # Build field path for logging
-                    field_name = "unknown field"
-                    if hasattr(info, "field_name") and info.field_name:
-                        field_name = info.field_name
-
-                    logger.warning(
-                        f"Field '{field_name}': Unexpected value '{str_value}'. "
-                        f"Expected one of: {', '.join(sorted(cls._expected_values))}"
-                    )
-                return str_value
-
-            return core_schema.with_info_after_validator_function(
-                validate_and_log,
-                core_schema.union_schema(
-                    [
-                        core_schema.none_schema(),
-                        core_schema.str_schema(),
-                    ]
-                ),
-            )
+                # Build field path for logging
+                field_name = "unknown field"
+                if hasattr(info, "field_name") and info.field_name:
+                    field_name = info.field_name
+
+                logger.warning(
+                    "Field '%s': Unexpected value '%s'. Expected one of: %s",
+                    field_name,
+                    value,
+                    cls._expected_values_text,
+                )
+                return value
+
+            choices: list[core_schema.CoreSchema] = [core_schema.none_schema()]
+            if cls._expected_values:
+                choices.append(core_schema.literal_schema(list(cls._expected_values)))
+            choices.append(core_schema.with_info_after_validator_function(log_unexpected, core_schema.str_schema()))
+            return core_schema.union_schema(choices, mode="left_to_right")
 
     return _RelaxedLiteral
@@ -24,7 +24,7 @@ _ItemT = typing.TypeVar("_ItemT", bound=pydantic.BaseModel)
 # ---------------------------------------------------------------------------
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class _PageState:
     """Encodes CH API pagination state as a portable JSON string.
 
@@ -202,6 +202,10 @@ class MultipageList(pydantic.BaseModel, typing.Generic[_ItemT]):
         # Request at least 100 items (may trigger multiple underlying API calls)
         page = await client.search_companies("Apple", result_count=100)
         # page.data has >= 100 items (or all available if fewer exist)
+
+    All pages are fetched before the ``MultipageList`` is returned and the
+    object is frozen, so it can be shared between tasks and read without any
+    locking.
     """
 
     model_config = pydantic.ConfigDict(frozen=True, arbitrary_types_allowed=True)
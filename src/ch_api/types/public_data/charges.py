@@ -527,6 +527,23 @@ class ChargeDetails(base.BaseModel):
     ]
 
 
+#: Scalar :class:`ChargeDetails` fields exposed by :meth:`ChargeList.to_columns`.
+CHARGE_COLUMNS: typing.Final[tuple[str, ...]] = (
+    "id",
+    "charge_number",
+    "charge_code",
+    "status",
+    "assests_ceased_released",
+    "acquired_on",
+    "delivered_on",
+    "resolved_on",
+    "covering_instrument_date",
+    "created_on",
+    "satisfied_on",
+    "more_than_four_persons_entitled",
+)
+
+
 class ChargeList(base.BaseModel):
     """List of charges for a company."""
 
@@ -575,3 +592,39 @@ class ChargeList(base.BaseModel):
             default=None,
         ),
     ]
+
+    def to_columns(self) -> dict[str, list[typing.Any]]:
+        """Return the scalar charge fields as one list per field.
+
+        Analytical passes over a charge history ("all satisfied dates",
+        "how many outstanding") only read one or two fields; a column per
+        field keeps those scans to a single flat list instead of walking every
+        :class:`ChargeDetails` object.
+
+        Returns
+        -------
+        dict[str, list]
+            Mapping of each name in :data:`CHARGE_COLUMNS` to the values of that
+            field, in ``items`` order. The lists are a snapshot: changes to
+            ``items`` afterwards are not reflected.
+
+        Example
+        -------
+        Count outstanding charges::
+
+            >>> charges = ChargeList.model_validate({
+            ...     "etag": "abc",
+            ...     "items": [
+            ...         {"etag": "1", "status": "outstanding", "charge_number": 1,
+            ...          "classification": {"type": "charge-description", "description": "Legal charge"}},
+            ...         {"etag": "2", "status": "fully-satisfied", "charge_number": 2,
+            ...          "classification": {"type": "charge-description", "description": "Debenture"}},
+            ...     ],
+            ... })
+            >>> columns = charges.to_columns()
+            >>> columns["charge_number"]
+            [1, 2]
+            >>> columns["status"].count("outstanding")
+            1
+        """
+        return shared._to_columns(self.items, CHARGE_COLUMNS)
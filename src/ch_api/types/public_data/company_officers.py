@@ -39,6 +39,7 @@ Models in this Module
 - :class:`ItemLinkTypes` - Links to officer resources
 - :class:`OfficerAppointmentDates` - Appointment and resignation dates
 - And other supporting officer models
+- :func:`addresses_columnar` - Officer addresses as one list per address field
 
 Example Usage
 -----
@@ -47,7 +48,7 @@ Fetch officers for a company::
     >>> async def get_officers_example(client):
     ...     officers = await client.get_officer_list("09370755")
     ...     count = 0
-    ...     async for officer in officers:
+    ...     for officer in officers.data:
     ...         count += 1
     ...         if count >= 1:
     ...             break
@@ -71,6 +72,7 @@ ch_api.types.public_data.officer_appointments : Detailed appointment records
 """
 
 import datetime
+import operator
 import typing
 
 import pydantic
@@ -99,6 +101,8 @@ class OfficerLinks(shared.LinksSection):
 class ItemLinkTypes(base.BaseModel):
     """Links to other resources associated with this officer list item."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     self: typing.Annotated[
         str,
         pydantic.Field(
@@ -190,85 +194,18 @@ class Address(base.BaseModel):
     ]
 
 
-class PrincipalOfficeAddress(base.BaseModel):
-    """Principal office address of a corporate managing officer."""
-
-    address_line_1: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The first line of the address.",
-            default=None,
-        ),
-    ]
-
-    address_line_2: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The second line of the address.",
-            default=None,
-        ),
-    ]
-
-    care_of: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The care of name.",
-            default=None,
-        ),
-    ]
-
-    country: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The country e.g. United Kingdom.",
-            default=None,
-        ),
-    ]
-
-    locality: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The locality e.g. London.",
-            default=None,
-        ),
-    ]
-
-    po_box: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The post-office box number.",
-            default=None,
-        ),
-    ]
-
-    postal_code: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The postal code e.g. CF14 3UZ.",
-            default=None,
-        ),
-    ]
-
-    premises: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The property name or number.",
-            default=None,
-        ),
-    ]
-
-    region: typing.Annotated[
-        str | None,
-        pydantic.Field(
-            description="The region e.g. Surrey.",
-            default=None,
-        ),
-    ]
+#: Principal office address of a corporate managing officer.
+#:
+#: The API documents this with exactly the same fields as :class:`Address`, so
+#: it is the same model; pydantic builds one validator for both fields.
+PrincipalOfficeAddress = Address
 
 
 class ContactDetails(base.BaseModel):
     """Contact details for a corporate managing officer."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     contact_name: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -281,6 +218,8 @@ class ContactDetails(base.BaseModel):
 class DateOfBirth(base.BaseModel):
     """Date of birth information for an officer."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     month: typing.Annotated[
         int,
         pydantic.Field(
@@ -299,6 +238,8 @@ class DateOfBirth(base.BaseModel):
 class FormerNames(base.BaseModel):
     """Former names for an officer."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     forenames: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -319,6 +260,8 @@ class FormerNames(base.BaseModel):
 class CorporateIdent(base.BaseModel):
     """Corporate identification information for an officer."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     identification_type: typing.Annotated[
         str | None,
         field_types.RelaxedLiteral(
@@ -372,6 +315,7 @@ class OfficerSummary(base.BaseModel):
 
     address: typing.Annotated[
         Address | None,
+        field_types.EmptyObjectAsNone,
         pydantic.Field(
             description="The correspondence address of the officer.",
             default=None,
@@ -493,6 +437,7 @@ class OfficerSummary(base.BaseModel):
 
     principal_office_address: typing.Annotated[
         PrincipalOfficeAddress | None,
+        field_types.EmptyObjectAsNone,
         pydantic.Field(
             description=(
                 "The principal/registered office address of a `corporate-managing-officer` "
@@ -576,3 +521,74 @@ class OfficerSummary(base.BaseModel):
             default=None,
         ),
     ]
+
+    def as_tuple(self) -> tuple[typing.Any, ...]:
+        """Return the field values as a tuple ordered like :data:`OFFICER_FIELDS`.
+
+        Useful for feeding rows into a DB cursor or DataFrame constructor: the
+        values are fetched with one precompiled :func:`operator.attrgetter`
+        call rather than one ``getattr`` per field.
+
+        Example
+        -------
+        ::
+
+            >>> officer = OfficerSummary.model_validate({
+            ...     "name": "SMITH, John", "officer_role": "director",
+            ...     "links": {"self": "/a", "officer": {"appointments": "/b"}},
+            ... })
+            >>> row = dict(zip(OFFICER_FIELDS, officer.as_tuple()))
+            >>> row["name"], row["officer_role"]
+            ('SMITH, John', 'director')
+        """
+        return _officer_row(self)
+
+
+#: OfficerSummary fields in the order returned by :meth:`OfficerSummary.as_tuple`.
+OFFICER_FIELDS: typing.Final[tuple[str, ...]] = tuple(OfficerSummary.model_fields)
+
+_officer_row = operator.attrgetter(*OFFICER_FIELDS)
+
+
+#: Address fields returned by :func:`addresses_columnar`, in declaration order.
+ADDRESS_COLUMNS: typing.Final[tuple[str, ...]] = tuple(Address.model_fields)
+
+
+def addresses_columnar(officers: typing.Iterable[OfficerSummary]) -> dict[str, list[str | None]]:
+    """Return the officers' correspondence addresses as one list per address field.
+
+    Batch consumers that only need e.g. every postal code or country on a page
+    can read a single flat list instead of walking each officer's
+    :class:`Address`.
+
+    Parameters
+    ----------
+    officers : Iterable[OfficerSummary]
+        Officers to collect, e.g. the result of ``client.get_officer_list(...)``.
+
+    Returns
+    -------
+    dict[str, list[str | None]]
+        Mapping of each name in :data:`ADDRESS_COLUMNS` to that field's value
+        for every officer, in iteration order. Officers without an address
+        contribute ``None`` to every column.
+
+    Example
+    -------
+    Collect postal codes::
+
+        >>> officers = [
+        ...     OfficerSummary.model_validate({
+        ...         "name": "SMITH, John", "officer_role": "director",
+        ...         "address": {"postal_code": "CF14 3UZ"},
+        ...         "links": {"self": "/a", "officer": {"appointments": "/b"}},
+        ...     }),
+        ...     OfficerSummary.model_validate({
+        ...         "name": "JONES, Ann", "officer_role": "secretary",
+        ...         "links": {"self": "/c", "officer": {"appointments": "/d"}},
+        ...     }),
+        ... ]
+        >>> addresses_columnar(officers)["postal_code"]
+        ['CF14 3UZ', None]
+    """
+    return shared._to_columns([officer.address for officer in officers], ADDRESS_COLUMNS)
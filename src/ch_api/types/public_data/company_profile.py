@@ -77,6 +77,8 @@ from .. import base, field_types, shared
 class AccountingReferenceDate(base.BaseModel):
     """Accounting Reference Date (ARD) for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     day: typing.Annotated[
         int,
         pydantic.Field(
@@ -95,6 +97,8 @@ class AccountingReferenceDate(base.BaseModel):
 class LastAccounts(base.BaseModel):
     """The last company accounts filed."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     made_up_to: typing.Annotated[
         datetime.date,
         pydantic.Field(
@@ -152,6 +156,8 @@ class LastAccounts(base.BaseModel):
 class NextAccounts(base.BaseModel):
     """The next company accounts to be filed."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     due_on: typing.Annotated[
         datetime.date | None,
         pydantic.Field(
@@ -188,6 +194,8 @@ class NextAccounts(base.BaseModel):
 class AccountsInformation(base.BaseModel):
     """Company accounts information."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     accounting_reference_date: typing.Annotated[
         AccountingReferenceDate | None,
         pydantic.Field(
@@ -238,6 +246,8 @@ class AccountsInformation(base.BaseModel):
 class AnnualReturnInformation(base.BaseModel):
     """Annual return information for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     last_made_up_to: typing.Annotated[
         datetime.date | None,
         pydantic.Field(
@@ -282,6 +292,8 @@ class AnnualReturnInformation(base.BaseModel):
 class ConfirmationStatementInformation(base.BaseModel):
     """Confirmation statement information for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     last_made_up_to: typing.Annotated[
         datetime.date | None,
         pydantic.Field(
@@ -316,6 +328,8 @@ class ConfirmationStatementInformation(base.BaseModel):
 class PreviousCompanyNames(base.BaseModel):
     """Previous name for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     name: typing.Annotated[
         str,
         pydantic.Field(
@@ -341,6 +355,8 @@ class PreviousCompanyNames(base.BaseModel):
 class CorporateAnnotation(base.BaseModel):
     """Corporate annotation for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     created_on: typing.Annotated[
         datetime.date,
         pydantic.Field(
@@ -370,6 +386,8 @@ class CorporateAnnotation(base.BaseModel):
 class AccountPeriodFrom(base.BaseModel):
     """Account period start date."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     day: typing.Annotated[
         int | None,
         pydantic.Field(
@@ -390,6 +408,8 @@ class AccountPeriodFrom(base.BaseModel):
 class AccountPeriodTo(base.BaseModel):
     """Account period end date."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     day: typing.Annotated[
         int | None,
         pydantic.Field(
@@ -410,6 +430,8 @@ class AccountPeriodTo(base.BaseModel):
 class FileWithin(base.BaseModel):
     """Time period within which accounts must be filed."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     months: typing.Annotated[
         int | None,
         pydantic.Field(
@@ -422,6 +444,8 @@ class FileWithin(base.BaseModel):
 class AccountInformation(base.BaseModel):
     """Foreign company account information."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     account_period_from: typing.Annotated[
         AccountPeriodFrom | None,
         pydantic.Field(
@@ -450,6 +474,8 @@ class AccountInformation(base.BaseModel):
 class AccountsRequired(base.BaseModel):
     """Accounting requirements for a foreign company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     foreign_account_type: typing.Annotated[
         str | None,
         field_types.RelaxedLiteral(
@@ -485,6 +511,8 @@ class AccountsRequired(base.BaseModel):
 class OriginatingRegistry(base.BaseModel):
     """Information about the originating registry of a foreign company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     country: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -505,6 +533,8 @@ class OriginatingRegistry(base.BaseModel):
 class ForeignCompanyDetails(base.BaseModel):
     """Foreign company details."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     originating_registry: typing.Annotated[
         OriginatingRegistry | None,
         pydantic.Field(
@@ -573,6 +603,8 @@ class ForeignCompanyDetails(base.BaseModel):
 class RegisteredOfficeAddress(base.BaseModel):
     """Registered office address for a company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     care_of: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -658,6 +690,8 @@ class RegisteredOfficeAddress(base.BaseModel):
 class ServiceAddress(base.BaseModel):
     """Service address of a Registered overseas entity."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     care_of: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -726,6 +760,8 @@ class ServiceAddress(base.BaseModel):
 class BranchCompanyDetails(base.BaseModel):
     """UK branch of a foreign company."""
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     business_activity: typing.Annotated[
         str | None,
         pydantic.Field(
@@ -759,6 +795,8 @@ class CompanyProfileLinks(shared.LinksSection):
     declared explicitly so IDEs and type checkers can see them.
     """
 
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     filing_history: typing.Annotated[
         str | None,
         pydantic.Field(
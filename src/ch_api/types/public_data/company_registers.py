@@ -75,90 +75,93 @@ class LinksItems(base.BaseModel):
     ]
 
 
-class LinksDirectorsRegister(base.BaseModel):
-    """Links for directors register."""
+def _link_absent(value: str | None) -> bool:
+    """Return whether a register link is unset and should be left out of dumps."""
+    return value is None
+
+
+class RegisterLinks(base.BaseModel):
+    """Links for a register list.
+
+    Each register list only populates the link for its own register; links
+    that are not set are left out when the model is serialized, so a dump
+    only contains the keys the API sent.
+    """
 
     directors_register: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the directors register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksSecretaryRegister(base.BaseModel):
-    """Links for secretary register."""
-
     secretaries_register: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the secretaries register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksPersonsWithSignificantControlRegister(base.BaseModel):
-    """Links for persons with significant control register."""
-
     persons_with_significant_control_register: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the persons with significant control register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksListUsualResidentialAddress(base.BaseModel):
-    """Links for usual residential address register."""
-
     usual_residential_address: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the usual residential address register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksListLLPUsualResidentialAddress(base.BaseModel):
-    """Links for LLP usual residential address register."""
-
     llp_usual_residential_address: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the LLP usual residential address register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksListMembers(base.BaseModel):
-    """Links for members register."""
-
     members: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the members register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
-
-class LinksListLLPMembers(base.BaseModel):
-    """Links for LLP members register."""
-
     llp_members: typing.Annotated[
         str | None,
         pydantic.Field(
-            description="The URL for the resource.",
+            description="The URL for the LLP members register.",
             default=None,
+            exclude_if=_link_absent,
         ),
     ]
 
 
+#: The register lists share one links model; these names are kept for compatibility.
+LinksDirectorsRegister = RegisterLinks
+LinksSecretaryRegister = RegisterLinks
+LinksPersonsWithSignificantControlRegister = RegisterLinks
+LinksListUsualResidentialAddress = RegisterLinks
+LinksListLLPUsualResidentialAddress = RegisterLinks
+LinksListMembers = RegisterLinks
+LinksListLLPMembers = RegisterLinks
+
+
 class RegisteredItems(base.BaseModel):
     """Registered item information."""
 
@@ -209,7 +212,7 @@ class RegisterListDirectors(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksDirectorsRegister | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -236,7 +239,7 @@ class RegisterListSecretaries(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksSecretaryRegister | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -263,7 +266,7 @@ class RegisterListPersonsWithSignificantControl(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksPersonsWithSignificantControlRegister | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -290,7 +293,7 @@ class RegisterListUsualResidentialAddress(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksListUsualResidentialAddress | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -317,7 +320,7 @@ class RegisterListLLPUsualResidentialAddress(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksListLLPUsualResidentialAddress | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -344,7 +347,7 @@ class RegisterListMembers(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksListMembers | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
@@ -371,7 +374,7 @@ class RegisterListLLPMembers(base.BaseModel):
     ]
 
     links: typing.Annotated[
-        LinksListLLPMembers | None,
+        RegisterLinks | None,
         pydantic.Field(
             description="A set of URLs related to the resource.",
             default=None,
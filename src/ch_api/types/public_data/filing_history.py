@@ -69,7 +69,7 @@ Fetch filing history for a company::
     client = Client(credentials=auth)
 
     filings = await client.get_company_filing_history("09370755")
-    async for filing in filings:
+    for filing in filings.data:
         print(f"{filing.type}: {filing.date}")
 
 Filter by filing category::
@@ -366,6 +366,20 @@ class FilingHistoryItem(base.BaseModel):
     ]
 
 
+#: Scalar :class:`FilingHistoryItem` fields exposed by :meth:`FilingHistoryList.to_columns`.
+FILING_HISTORY_COLUMNS: typing.Final[tuple[str, ...]] = (
+    "transaction_id",
+    "category",
+    "subcategory",
+    "type",
+    "date",
+    "description",
+    "barcode",
+    "pages",
+    "paper_filed",
+)
+
+
 class FilingHistoryList(base.BaseModel):
     """Filing history list for a company."""
 
@@ -423,3 +437,27 @@ class FilingHistoryList(base.BaseModel):
             default=None,
         ),
     ]
+
+    def to_columns(self) -> dict[str, list[typing.Any]]:
+        """Return the :data:`FILING_HISTORY_COLUMNS` fields of ``items`` as one list per field.
+
+        Example
+        -------
+        Select the accounts filings::
+
+            >>> filings = FilingHistoryList.model_validate({
+            ...     "items": [
+            ...         {"transaction_id": "A1", "category": "accounts", "date": "2024-01-31",
+            ...          "description": "accounts-with-accounts-type-micro-entity", "type": "AA"},
+            ...         {"transaction_id": "C1", "category": "confirmation-statement", "date": "2024-02-01",
+            ...          "description": "confirmation-statement-with-no-updates", "type": "CS01"},
+            ...     ],
+            ...     "items_per_page": 25,
+            ...     "start_index": 0,
+            ...     "total_count": 2,
+            ... })
+            >>> columns = filings.to_columns()
+            >>> [tid for tid, category in zip(columns["transaction_id"], columns["category"]) if category == "accounts"]
+            ['A1']
+        """
+        return shared._to_columns(self.items, FILING_HISTORY_COLUMNS)
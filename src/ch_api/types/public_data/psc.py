@@ -83,7 +83,7 @@ Fetch PSC list for a company::
     client = Client(credentials=auth)
 
     psc_list = await client.get_company_psc_list("09370755")
-    async for psc in psc_list.items:
+    for psc in psc_list.data:
         print(f"PSC: {psc.name}")
 
 Get detailed PSC information::
@@ -55,17 +55,17 @@ Search for companies::
 
     # Simple search
     results = await client.search_companies("Apple")
-    async for company in results:
+    for company in results.data:
         print(f"{company.title} ({company.company_number})")
 
     # Search all types
     results = await client.search("Barclays")
-    async for result in results:
+    for result in results.data:
         print(f"{result.title}")
 
     # Search officers
     officers = await client.search_officers("Smith")
-    async for officer in officers:
+    for officer in officers.data:
         print(f"{officer.title}")
 
 Pagination
@@ -92,7 +92,7 @@ Alphabetical search::
     >>> async def alphabetical_search_example(client):
     ...     results = await client.alphabetical_companies_search("BBC")
     ...     count = 0
-    ...     async for company in results:
+    ...     for company in results.data:
     ...         count += 1
     ...         if count >= 1:
     ...             break
@@ -104,7 +104,7 @@ Dissolved company search::
     >>> async def dissolved_search_example(client):
     ...     dissolved = await client.search_dissolved_companies("Enron")
     ...     count = 0
-    ...     async for company in dissolved:
+    ...     for company in dissolved.data:
     ...         count += 1
     ...         if count >= 1:
     ...             break
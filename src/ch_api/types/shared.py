@@ -24,6 +24,9 @@ ch_api.types.base : Base model configuration
 ch_api.types.public_data : Models using these shared types
 """
 
+import operator
+import typing
+
 import pydantic
 
 from . import base
@@ -165,9 +168,43 @@ class LinksSection(base.BaseModel):
         """
         # Check explicit model fields first (subclasses may declare known link names
         # as typed attributes — e.g. FilingHistoryLinks.document_metadata).
-        if name in self.model_fields and (value := getattr(self, name, None)) is not None:
+        if name in type(self).model_fields and (value := getattr(self, name, None)) is not None:
             return value
         # Fall back to pydantic extra fields for undeclared / dynamic links.
         if self.__pydantic_extra__ is None:
             return None
         return self.__pydantic_extra__.get(name, None)
+
+
+def _to_columns(items: typing.Iterable[typing.Any], columns: typing.Sequence[str]) -> dict[str, list[typing.Any]]:
+    """Return the ``columns`` attributes of ``items`` as one list per attribute.
+
+    Used by the ``to_columns``-style views on list models: scans that read one
+    or two fields can then run over flat lists instead of model objects.
+
+    Parameters
+    ----------
+    items : Iterable
+        Objects to read, typically models. ``None`` entries contribute ``None``
+        to every column.
+    columns : Sequence[str]
+        Attribute names to collect, in the order of the returned mapping.
+
+    Returns
+    -------
+    dict[str, list]
+        Mapping of each name in ``columns`` to the values of that attribute, in
+        ``items`` order. The lists are a snapshot of the items.
+
+    Example
+    -------
+    >>> _to_columns([LinksSection(self="/a"), None], ("self",))
+    {'self': ['/a', None]}
+    """
+    getter = operator.attrgetter(*columns)
+    read_row = getter if len(columns) > 1 else lambda item: (getter(item),)
+    missing_row = (None,) * len(columns)
+    rows = [missing_row if item is None else read_row(item) for item in items]
+    if not rows:
+        return {name: [] for name in columns}
+    return {name: list(values) for name, values in zip(columns, zip(*rows, strict=True), strict=True)}
@@ -1,6 +1,9 @@
 """Branch coverage tests for api.py — covers all remaining uncovered lines."""
 
+import asyncio
 import datetime
+import traceback
+import urllib.parse
 from unittest.mock import MagicMock
 
 import httpx
@@ -99,6 +102,71 @@ class TestCursorPaginationContinuation:
         assert call_count == 2
 
 
+class TestOffsetPaginationState:
+    """_fetch_paginated() tracks the next offset across pages."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_points_after_last_fetched_item(self):
+        client = _make_client()
+        starts_seen = []
+
+        class _Item(pydantic.BaseModel):
+            val: int = 0
+
+        async def fetch_fn(start_index):
+            starts_seen.append(start_index)
+            return [_Item(val=start_index), _Item(val=start_index + 1)], 10
+
+        page = await client._fetch_paginated(fetch_fn, None, 3)
+        assert starts_seen == [0, 2]
+        assert page.pagination.has_next
+        assert client._decode_next_page(page.pagination.next_page).start_index == 4
+
+    @pytest.mark.asyncio
+    async def test_empty_page_stops_even_if_total_is_larger(self):
+        client = _make_client()
+
+        async def fetch_fn(start_index):
+            return [], 10
+
+        page = await client._fetch_paginated(fetch_fn, None, 5)
+        assert not page.pagination.has_next
+        assert page.pagination.next_page is None
+        assert page.pagination.size == 10
+
+
+class TestMultipageListConstruction:
+    """Collected items are handed to MultipageList without being copied."""
+
+    @pytest.mark.asyncio
+    async def test_offset_pages_keep_item_instances(self):
+        client = _make_client()
+
+        class _Item(pydantic.BaseModel):
+            val: int = 0
+
+        pages = {0: [_Item(val=1), _Item(val=2)], 2: [_Item(val=3)]}
+
+        async def fetch_fn(start_index):
+            return pages[start_index], 3
+
+        page = await client._fetch_paginated(fetch_fn, None, 3)
+        assert [id(item) for item in page.data] == [id(item) for item in pages[0] + pages[2]]
+        assert page.pagination == pagination_types.PaginationInfo(has_next=False, size=3)
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_keep_item_instances(self):
+        client = _make_client()
+        item = _alpha_company()
+
+        async def fetch_fn(cursor):
+            return [item], None
+
+        page = await client._fetch_paginated_cursor(fetch_fn, None, 1)
+        assert page.data[0] is item
+        assert not page.pagination.has_next
+
+
 class TestAlphabeticalSearchBranches:
     """Lines 719, 729 — search_below param + empty items in alphabetical search."""
 
@@ -167,6 +235,100 @@ class TestAlphabeticalSearchBranches:
         assert call_count == 2
 
 
+class TestCursorPageSize:
+    """Cursor-based searches raise the requested page size towards result_count."""
+
+    @pytest.mark.parametrize(
+        "page_size, result_count, expected",
+        [
+            (10, 1, 10),
+            (10, 50, 50),
+            (10, 500, 100),
+            (100, 1, 100),
+            (100, 500, 100),
+        ],
+    )
+    def test_cursor_page_size(self, page_size, result_count, expected):
+        assert api._cursor_page_size(page_size, result_count) == expected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("search", ["alphabetical_companies_search", "search_dissolved_companies"])
+    async def test_page_size_above_api_maximum_is_rejected(self, search):
+        client = _make_client()
+
+        async def fake_get_resource(url, result_type):
+            raise AssertionError("no request expected")
+
+        client._get_resource = fake_get_resource
+        with pytest.raises(pydantic.ValidationError):
+            await getattr(client, search)("test", page_size=101)
+
+    @pytest.mark.asyncio
+    async def test_later_pages_request_only_remaining_results(self):
+        client = _make_client()
+        urls_seen = []
+
+        async def fake_get_resource(url, result_type):
+            urls_seen.append(url)
+            size = int(urllib.parse.parse_qs(urllib.parse.urlparse(url).query)["size"][0])
+            return MagicMock(items=[_alpha_company(f"KEY:{len(urls_seen)}")] * size)
+
+        client._get_resource = fake_get_resource
+        page = await client.alphabetical_companies_search("test", result_count=150)
+
+        sizes = [urllib.parse.parse_qs(urllib.parse.urlparse(url).query)["size"] for url in urls_seen]
+        assert sizes == [["100"], ["50"]]
+        assert len(page.data) == 150
+
+    @pytest.mark.asyncio
+    async def test_alphabetical_search_requests_larger_page(self):
+        client = _make_client()
+        urls_seen = []
+
+        async def fake_get_resource(url, result_type):
+            urls_seen.append(url)
+            return MagicMock(items=[])
+
+        client._get_resource = fake_get_resource
+        await client.alphabetical_companies_search("test", result_count=50)
+        assert urls_seen == [f"{api_settings.LIVE_API_SETTINGS.api_url}/alphabetical-search/companies?q=test&size=50"]
+
+    @pytest.mark.asyncio
+    async def test_dissolved_search_keeps_page_size_for_small_requests(self):
+        client = _make_client()
+        urls_seen = []
+
+        async def fake_get_resource(url, result_type):
+            urls_seen.append(url)
+            return MagicMock(items=[])
+
+        client._get_resource = fake_get_resource
+        await client.search_dissolved_companies("test", page_size=20)
+        assert all("size=20" in u for u in urls_seen)
+
+
+class TestParametrizedResultTypes:
+    """Generic result models are parametrized once and reused across requests."""
+
+    def test_matches_direct_subscription(self):
+        resolved = api._parametrized(sc.GenericSearchResult, sc.AdvancedCompany)
+        assert resolved is sc.GenericSearchResult[sc.AdvancedCompany]
+
+    @pytest.mark.asyncio
+    async def test_repeated_requests_reuse_result_type(self):
+        client = _make_client()
+        result_types = []
+
+        async def fake_get_resource(url, result_type):
+            result_types.append(result_type)
+            return MagicMock(items=[])
+
+        client._get_resource = fake_get_resource
+        await client.alphabetical_companies_search("alpha")
+        await client.alphabetical_companies_search("beta")
+        assert result_types[0] is result_types[1]
+
+
 class TestDissolvedSearchBranches:
     """Lines 766, 776 — search_below param + empty items in dissolved search."""
 
@@ -693,6 +855,167 @@ class TestPscStatementsBranches:
             await client.get_company_psc_statements("12345678")
 
 
+class TestInflightGetSharing:
+    """_get_resource() shares one request between concurrent identical calls."""
+
+    @staticmethod
+    def _client_with_slow_execute(result=None, error=None):
+        client = _make_client()
+        calls = []
+        release = asyncio.Event()
+
+        async def fake_execute(request, expected_out):
+            calls.append(str(request.url))
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                calls.append("cancelled")
+                raise
+            if error is not None:
+                raise error
+            return result
+
+        client._execute_request = fake_execute
+        return client, calls, release
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self):
+        result = _alpha_company()
+        client, calls, release = self._client_with_slow_execute(result=result)
+
+        tasks = [asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [result, result, result]
+        assert calls == ["http://x/a"]
+        assert client._inflight_gets == {}
+
+    @pytest.mark.asyncio
+    async def test_later_callers_get_their_own_copy(self):
+        result = _alpha_company()
+        client, calls, release = self._client_with_slow_execute(result=result)
+
+        tasks = [asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        first, second, third = await asyncio.gather(*tasks)
+
+        assert first is result
+        assert second is not result and third is not result and second is not third
+        assert second.links is not result.links
+
+    @pytest.mark.asyncio
+    async def test_different_urls_are_not_shared(self):
+        client, calls, release = self._client_with_slow_execute()
+
+        tasks = [
+            asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany)),
+            asyncio.create_task(client._get_resource("http://x/b", sc.AlphabeticalCompany)),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert sorted(calls) == ["http://x/a", "http://x/b"]
+
+    @pytest.mark.asyncio
+    async def test_error_reaches_every_waiter(self):
+        client, calls, release = self._client_with_slow_execute(error=_http_error(500))
+
+        tasks = [asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert calls == ["http://x/a"]
+        assert client._inflight_gets == {}
+
+    @pytest.mark.asyncio
+    async def test_each_waiter_gets_its_own_error(self):
+        error = _http_error(500)
+        client, calls, release = self._client_with_slow_execute(error=error)
+
+        async def first_caller():
+            return await client._get_resource("http://x/a", sc.AlphabeticalCompany)
+
+        async def second_caller():
+            return await client._get_resource("http://x/a", sc.AlphabeticalCompany)
+
+        tasks = [asyncio.create_task(first_caller()), asyncio.create_task(second_caller())]
+        await asyncio.sleep(0)
+        release.set()
+        first_err, second_err = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert isinstance(first_err, httpx.HTTPStatusError) and isinstance(second_err, httpx.HTTPStatusError)
+        assert first_err is not second_err
+        assert first_err.response is second_err.response is error.response
+        first_frames = {frame.f_code.co_name for frame, _ in traceback.walk_tb(first_err.__traceback__)}
+        second_frames = {frame.f_code.co_name for frame, _ in traceback.walk_tb(second_err.__traceback__)}
+        assert "first_caller" in first_frames and "second_caller" not in first_frames
+        assert "second_caller" in second_frames and "first_caller" not in second_frames
+        assert calls == ["http://x/a"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_not_cached(self):
+        client, calls, release = self._client_with_slow_execute()
+        release.set()
+
+        await client._get_resource("http://x/a", sc.AlphabeticalCompany)
+        await client._get_resource("http://x/a", sc.AlphabeticalCompany)
+
+        assert calls == ["http://x/a", "http://x/a"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self):
+        result = _alpha_company()
+        client, calls, release = self._client_with_slow_execute(result=result)
+
+        first = asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany))
+        second = asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == result
+        assert first.cancelled()
+        assert calls == ["http://x/a"]
+
+    @pytest.mark.asyncio
+    async def test_cancelling_only_caller_cancels_request(self):
+        client, calls, release = self._client_with_slow_execute()
+
+        caller = asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany))
+        await asyncio.sleep(0)
+        shared = client._inflight_gets[("http://x/a", sc.AlphabeticalCompany)].task
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        with pytest.raises(asyncio.CancelledError):
+            await shared
+
+        assert shared.cancelled()
+        assert calls == ["http://x/a", "cancelled"]
+        assert client._inflight_gets == {}
+
+    @pytest.mark.asyncio
+    async def test_new_caller_after_cancellation_starts_new_request(self):
+        result = _alpha_company()
+        client, calls, release = self._client_with_slow_execute(result=result)
+
+        caller = asyncio.create_task(client._get_resource("http://x/a", sc.AlphabeticalCompany))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        release.set()
+
+        assert await client._get_resource("http://x/a", sc.AlphabeticalCompany) is result
+        assert calls == ["http://x/a", "cancelled", "http://x/a"]
+        assert client._inflight_gets == {}
+
+
 class TestSessionRestart:
     """_execute_request auto-restarts closed sessions (owns_session=True only)."""
 
@@ -115,7 +115,6 @@ class TestExecuteRequestMethod:
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
         mock_response.content = b'{"key": "value"}'
-        mock_response.json.return_value = {"key": "value"}
         mock_response.raise_for_status.return_value = None
 
         # Create mock request
@@ -126,11 +125,12 @@ class TestExecuteRequestMethod:
 
         # Mock a simple model for testing
         mock_model = MagicMock()
-        mock_model.model_validate.return_value = {"validated": "data"}
+        mock_model.model_validate_json.return_value = {"validated": "data"}
 
         result = await client._execute_request(mock_request, mock_model)
 
         assert result == {"validated": "data"}
+        mock_model.model_validate_json.assert_called_once_with(b'{"key": "value"}')
         mock_response.raise_for_status.assert_called_once()
         client._api_session.send.assert_called_once_with(mock_request)
 
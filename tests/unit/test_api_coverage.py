@@ -1,5 +1,6 @@
 """Tests for API client methods."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -33,6 +34,8 @@ class TestCreateTestCompany:
         request = call_args[0][0]
         assert request.method == "POST"
         assert "test-companies" in request.url.path
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == company.model_dump(mode="json")
 
     @pytest.mark.asyncio
     async def test_create_test_company_no_url_raises_error(self):
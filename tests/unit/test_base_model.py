@@ -1,5 +1,9 @@
 """Unit tests for base model functionality."""
 
+import datetime
+import gc
+import weakref
+
 import pydantic
 import pytest
 
@@ -142,6 +146,106 @@ class TestBaseModelValidate:
         result = TestModel.model_validate(data)
         assert result.field == "value"
 
+    def test_model_validate_canonical_keys_skip_copy(self, mocker):
+        """Test that dicts with only declared field names are passed through unchanged."""
+
+        class TestModel(base.BaseModel):
+            field: str
+
+        data = {"field": "value"}
+        parent_validate = mocker.patch.object(pydantic.BaseModel, "model_validate")
+
+        TestModel.model_validate(data)
+
+        assert parent_validate.call_args.args[0] is data
+
+    def test_canonical_keys_cache_does_not_keep_classes_alive(self):
+        """Test the canonical key cache releases model classes that go away."""
+
+        class TestModel(base.BaseModel):
+            field: str
+
+        TestModel.model_validate({"field": "value"})
+        model_ref = weakref.ref(TestModel)
+        assert model_ref() in base._CANONICAL_KEYS
+
+        del TestModel
+        gc.collect()
+
+        assert model_ref() is None
+
+    def test_model_validate_interns_normalized_keys(self, mocker):
+        """Test normalized keys are interned so they share the field name object."""
+
+        class TestModel(base.BaseModel):
+            field_name: str
+
+        parent_validate = mocker.patch.object(pydantic.BaseModel, "model_validate")
+
+        TestModel.model_validate({" FIELD_NAME ": "value"})
+
+        (key,) = parent_validate.call_args.args[0]
+        assert key is next(iter(TestModel.model_fields))
+
+    def test_model_validate_forwards_keyword_arguments(self):
+        """Test that keyword arguments such as ``strict`` reach pydantic."""
+
+        class TestModel(base.BaseModel):
+            count: int
+
+        with pytest.raises(pydantic.ValidationError):
+            TestModel.model_validate({"COUNT": "5"}, strict=True)
+
+
+class TestBaseModelValidateJson:
+    """Test BaseModel.model_validate_json method."""
+
+    def test_model_validate_json_normalizes_field_names(self):
+        """Test JSON input goes through the same key normalization as dicts."""
+
+        class TestModel(base.BaseModel):
+            company_name: str
+
+        result = TestModel.model_validate_json(b'{" Company_Name ": "Test Corp", "[notinuse]old": 1}')
+
+        assert result.company_name == "Test Corp"
+
+    def test_model_validate_json_nested_models(self):
+        """Test nested models and typed fields are validated from JSON."""
+
+        class Inner(base.BaseModel):
+            count: int
+
+        class Outer(base.BaseModel):
+            inner: Inner
+
+        result = Outer.model_validate_json('{"inner": {"count": "3"}}')
+
+        assert result.inner.count == 3
+
+    def test_model_validate_json_invalid_json(self):
+        """Test malformed JSON raises a pydantic ValidationError."""
+
+        class TestModel(base.BaseModel):
+            name: str
+
+        with pytest.raises(pydantic.ValidationError) as exc_info:
+            TestModel.model_validate_json(b'{"name": ')
+
+        assert exc_info.value.errors()[0]["type"] == "json_invalid"
+
+    def test_model_validate_json_strict_uses_json_mode(self):
+        """Test strict validation keeps JSON-mode rules and key normalization."""
+
+        class TestModel(base.BaseModel):
+            incorporated_on: datetime.date
+
+        result = TestModel.model_validate_json(b'{"Incorporated_On": "2020-01-02"}', strict=True)
+
+        assert result.incorporated_on == datetime.date(2020, 1, 2)
+        with pytest.raises(pydantic.ValidationError):
+            TestModel.model_validate_json(b'{"incorporated_on": 20200102}', strict=True)
+
 
 class TestBaseModelInheritance:
     """Test BaseModel inheritance."""
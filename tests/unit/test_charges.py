@@ -0,0 +1,45 @@
+"""Unit tests for charge models."""
+
+import datetime
+
+from ch_api.types.public_data import charges
+
+
+def _charge(number: int, status: str, **extra) -> dict:
+    return {
+        "etag": f"etag-{number}",
+        "status": status,
+        "charge_number": number,
+        "classification": {"type": "charge-description", "description": "Legal charge"},
+        **extra,
+    }
+
+
+class TestChargeListColumns:
+    """Test ChargeList.to_columns."""
+
+    def test_columns_follow_item_order(self):
+        charge_list = charges.ChargeList.model_validate(
+            {
+                "etag": "list",
+                "items": [
+                    _charge(1, "outstanding", created_on="2020-01-02"),
+                    _charge(2, "fully-satisfied", satisfied_on="2021-03-04"),
+                ],
+            }
+        )
+
+        columns = charge_list.to_columns()
+
+        assert tuple(columns) == charges.CHARGE_COLUMNS
+        assert columns["charge_number"] == [1, 2]
+        assert columns["status"] == ["outstanding", "fully-satisfied"]
+        assert columns["created_on"] == [datetime.date(2020, 1, 2), None]
+        assert columns["satisfied_on"] == [None, datetime.date(2021, 3, 4)]
+
+    def test_empty_list_has_empty_columns(self):
+        charge_list = charges.ChargeList.model_validate({"etag": "list", "items": []})
+
+        columns = charge_list.to_columns()
+
+        assert columns == {name: [] for name in charges.CHARGE_COLUMNS}
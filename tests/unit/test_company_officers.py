@@ -0,0 +1,64 @@
+"""Unit tests for company officer models."""
+
+from ch_api.types.public_data import company_officers
+
+
+def _officer(name: str, **extra) -> company_officers.OfficerSummary:
+    return company_officers.OfficerSummary.model_validate(
+        {
+            "name": name,
+            "officer_role": "director",
+            "links": {"self": "/self", "officer": {"appointments": "/appointments"}},
+            **extra,
+        }
+    )
+
+
+class TestAddressesColumnar:
+    """Test addresses_columnar."""
+
+    def test_columns_follow_officer_order(self):
+        officers = [
+            _officer("SMITH, John", address={"postal_code": "CF14 3UZ", "country": "Wales"}),
+            _officer("JONES, Ann"),
+            _officer("BROWN, Lee", address={"locality": "London"}),
+        ]
+
+        columns = company_officers.addresses_columnar(officers)
+
+        assert tuple(columns) == company_officers.ADDRESS_COLUMNS
+        assert columns["postal_code"] == ["CF14 3UZ", None, None]
+        assert columns["country"] == ["Wales", None, None]
+        assert columns["locality"] == [None, None, "London"]
+
+    def test_no_officers(self):
+        columns = company_officers.addresses_columnar([])
+
+        assert columns == {name: [] for name in company_officers.ADDRESS_COLUMNS}
+
+
+class TestOfficerSummaryAsTuple:
+    """Test OfficerSummary.as_tuple."""
+
+    def test_values_follow_field_order(self):
+        officer = _officer("SMITH, John", occupation="Engineer")
+
+        row = officer.as_tuple()
+
+        assert len(row) == len(company_officers.OFFICER_FIELDS)
+        assert row == tuple(getattr(officer, name) for name in company_officers.OFFICER_FIELDS)
+
+
+class TestOfficerSummaryEmptyAddress:
+    """Test empty address objects are treated as missing."""
+
+    def test_empty_address_is_none(self):
+        officer = _officer("SMITH, John", address={}, principal_office_address={})
+
+        assert officer.address is None
+        assert officer.principal_office_address is None
+
+    def test_populated_address_is_kept(self):
+        officer = _officer("SMITH, John", address={"postal_code": "CF14 3UZ"})
+
+        assert officer.address == company_officers.Address(postal_code="CF14 3UZ")
@@ -0,0 +1,43 @@
+"""Unit tests for company register models."""
+
+from ch_api.types.public_data import company_registers
+
+
+class TestRegisterLinks:
+    """Test the shared register list links model."""
+
+    def test_register_lists_share_links_model(self):
+        registers = company_registers.Registers.model_validate(
+            {
+                "directors": {
+                    "register_type": "directors",
+                    "items": [],
+                    "links": {"directors_register": "/company/00000000/officers?register_type=directors"},
+                },
+                "members": {
+                    "register_type": "members",
+                    "items": [],
+                    "links": {"members": "/company/00000000/members"},
+                },
+            }
+        )
+
+        assert type(registers.directors.links) is company_registers.RegisterLinks
+        assert type(registers.members.links) is company_registers.RegisterLinks
+        assert registers.directors.links.directors_register == "/company/00000000/officers?register_type=directors"
+        assert registers.members.links.members == "/company/00000000/members"
+        assert registers.members.links.directors_register is None
+
+    def test_dump_only_contains_sent_links(self):
+        register_list = company_registers.RegisterListMembers.model_validate(
+            {"register_type": "members", "items": [], "links": {"members": "/company/00000000/members"}}
+        )
+
+        assert register_list.links.model_dump() == {"members": "/company/00000000/members"}
+        assert register_list.model_dump_json() == (
+            '{"register_type":"members","items":[],"links":{"members":"/company/00000000/members"}}'
+        )
+
+    def test_legacy_names_are_aliases(self):
+        assert company_registers.LinksDirectorsRegister is company_registers.RegisterLinks
+        assert company_registers.LinksListLLPMembers is company_registers.RegisterLinks
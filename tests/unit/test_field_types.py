@@ -1,6 +1,7 @@
 """Unit tests for field types module."""
 
 import logging
+import typing
 
 import pydantic
 
@@ -142,6 +143,60 @@ class TestRelaxedLiteral:
         assert result.field == "any-value"
         assert "Unexpected value" in caplog.text
 
+    def test_relaxed_literal_warning_formatted_lazily(self, caplog):
+        """Test the warning is passed to logging as a template with arguments."""
+        relaxed_type = field_types.RelaxedLiteral("active", "inactive")
+
+        class TestModel(pydantic.BaseModel):
+            status: relaxed_type
+
+        with caplog.at_level(logging.WARNING):
+            TestModel.model_validate({"status": "unknown"})
+
+        (record,) = caplog.records
+        assert record.args == ("status", "unknown", "active, inactive")
+        assert record.getMessage() == "Field 'status': Unexpected value 'unknown'. Expected one of: active, inactive"
+
+    def test_relaxed_literal_returns_shared_string_for_known_values(self):
+        """Test known values from separate inputs resolve to the same string object."""
+        relaxed_type = field_types.RelaxedLiteral("outstanding", "satisfied")
+
+        class TestModel(pydantic.BaseModel):
+            status: relaxed_type
+
+        # Build the inputs at runtime so they are distinct objects.
+        first = TestModel.model_validate({"status": "".join(["out", "standing"])})
+        second = TestModel.model_validate({"status": "".join(["outs", "tanding"])})
+
+        assert first.status is second.status
+
+    def test_relaxed_literal_json_schema_lists_expected_values(self):
+        """Test the JSON schema advertises the expected values as an enum."""
+        relaxed_type = field_types.RelaxedLiteral("beta", "alpha")
+
+        class TestModel(pydantic.BaseModel):
+            field: relaxed_type
+
+        choices = TestModel.model_json_schema()["properties"]["field"]["anyOf"]
+        assert {"enum": ["alpha", "beta"], "type": "string"} in choices
+        assert {"type": "string"} in choices
+
+    def test_relaxed_literal_from_json(self, caplog):
+        """Test known and unknown values validate from JSON input."""
+        relaxed_type = field_types.RelaxedLiteral("active")
+
+        class TestModel(pydantic.BaseModel):
+            status: relaxed_type
+
+        with caplog.at_level(logging.WARNING):
+            known = TestModel.model_validate_json('{"status": "active"}')
+            unknown = TestModel.model_validate_json('{"status": "closed"}')
+
+        assert known.status == "active"
+        assert unknown.status == "closed"
+        assert "Unexpected value 'closed'" in caplog.text
+        assert "Unexpected value 'active'" not in caplog.text
+
 
 class TestUndocumentedNullable:
     """Test UndocumentedNullable type alias."""
@@ -169,3 +224,18 @@ class TestUndocumentedNullable:
         # Should default to None
         result3 = TestModel.model_validate({"required_field": "test"})
         assert result3.optional_field is None
+
+
+class TestEmptyObjectAsNone:
+    """Test EmptyObjectAsNone validator."""
+
+    def test_empty_object_becomes_none(self):
+        class Inner(pydantic.BaseModel):
+            value: str | None = None
+
+        class TestModel(pydantic.BaseModel):
+            inner: typing.Annotated[Inner | None, field_types.EmptyObjectAsNone] = None
+
+        assert TestModel.model_validate({"inner": {}}).inner is None
+        assert TestModel.model_validate_json('{"inner": {}}').inner is None
+        assert TestModel.model_validate({"inner": {"value": "x"}}).inner == Inner(value="x")
@@ -0,0 +1,14 @@
+"""Unit tests for pagination types."""
+
+from ch_api.types.pagination import types as pagination_types
+
+
+class TestPageState:
+    """_PageState is a small slotted value object."""
+
+    def test_round_trip(self):
+        state = pagination_types._PageState(start_index=3, search_below="KEY:1")
+        assert pagination_types._PageState.decode(state.encode()) == state
+
+    def test_has_no_instance_dict(self):
+        assert not hasattr(pagination_types._PageState.first(), "__dict__")
@@ -1,6 +1,8 @@
 """Unit tests for shared data types."""
 
+import types
 import typing
+import warnings
 
 import pydantic
 
@@ -158,3 +160,34 @@ class TestLinksSection:
         # Field is explicit — not in __pydantic_extra__, but get_link should still find it.
         assert links.document_metadata == "https://document-api.example.com/document/XYZ"
         assert links.get_link("document_metadata") == "https://document-api.example.com/document/XYZ"
+
+    def test_links_section_get_link_no_deprecation_warning(self):
+        """Test get_link reads field definitions from the class, not the instance."""
+        links = shared.LinksSection.model_validate({"self": "/company/123"})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert links.get_link("self") == "/company/123"
+
+
+class TestToColumns:
+    """Test the _to_columns helper."""
+
+    def test_columns_follow_item_order(self):
+        items = [
+            types.SimpleNamespace(name="SMITH, John", role="director"),
+            None,
+            types.SimpleNamespace(name="JONES, Ann", role="secretary"),
+        ]
+
+        columns = shared._to_columns(items, ("name", "role"))
+
+        assert columns == {"name": ["SMITH, John", None, "JONES, Ann"], "role": ["director", None, "secretary"]}
+
+    def test_single_column(self):
+        columns = shared._to_columns([shared.LinksSection(self="/a")], ("self",))
+
+        assert columns == {"self": ["/a"]}
+
+    def test_no_items(self):
+        assert shared._to_columns([], ("name", "role")) == {"name": [], "role": []}